@@ -27,42 +27,89 @@ import com.defano.jsegue.renderers.ZoomOutEffect;
 import java.awt.*;
 import java.awt.event.*;
 import java.awt.image.BufferedImage;
+import java.awt.image.DataBufferInt;
 import java.io.*;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
 import java.util.ArrayList;
+import java.util.Collections;
 import java.util.List;
+import java.util.Set;
 import java.text.SimpleDateFormat;
 import java.util.Date;
+import java.util.concurrent.ThreadLocalRandom;
 import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicReference;
 import java.util.stream.Collectors;
+import java.util.stream.IntStream;
 
 import javax.imageio.ImageIO;
 import javax.swing.*;
 import java.time.LocalTime;
 import java.time.format.DateTimeFormatter;
-import java.util.Random;
 
 public class PhotoFrame extends JFrame implements SegueAnimationObserver {
 
     private static final int BLUR_RADIUS = 100;
+    private static final int UNREADABLE_PHOTO_RETRY_DELAY = 1000;
     private static long DEFAULT_ANIMATION_DURATION;
     private static int DEFAULT_SLEEP_DURATION;
     private static int DEFAULT_MAX_FPS;
 
-    private static final int DEFAULT_MAX_ANIMATIONS = 24; // this is all the animation segue supports.
+    // These are all the animations segue supports.
+    private static final List<Class<? extends AnimatedSegue>> EFFECTS = List.of(
+            PixelDissolveEffect.class,
+            AlphaDissolveEffect.class,
+            CheckerboardEffect.class,
+            BlindsEffect.class,
+            ScrollLeftEffect.class,
+            ScrollRightEffect.class,
+            ScrollUpEffect.class,
+            ScrollDownEffect.class,
+            WipeLeftEffect.class,
+            WipeRightEffect.class,
+            WipeUpEffect.class,
+            WipeDownEffect.class,
+            ZoomOutEffect.class,
+            ZoomInEffect.class,
+            IrisOpenEffect.class,
+            IrisCloseEffect.class,
+            BarnDoorOpenEffect.class,
+            BarnDoorCloseEffect.class,
+            ShrinkToBottomEffect.class,
+            ShrinkToTopEffect.class,
+            ShrinkToCenterEffect.class,
+            StretchFromBottomEffect.class,
+            StretchFromTopEffect.class,
+            StretchFromCenterEffect.class);
+    private static final Set<String> PHOTO_EXTENSIONS = Set.of(".jpg", ".png", ".jpeg", ".heic", ".heif");
+    private static final DateTimeFormatter LOG_TIME_FORMATTER = DateTimeFormatter.ofPattern("HH:mm:ss");
 
     private JPanel backPanel;
     private JLabel photoLabel;
+    private final FrameIcon photoIcon = new FrameIcon();
+    private final AtomicReference<BufferedImage> pendingFrame = new AtomicReference<>();
     JLabel dateLabel = new JLabel();
     JLabel timeLabel = new JLabel();
 
     private List<String> photos;
     private AnimatedSegue currentSegue;
+    private final List<Class<? extends AnimatedSegue>> effectOrder = new ArrayList<>(EFFECTS);
+    private int effectIdx = EFFECTS.size(); // shuffle on first use
     private int screenWidth;
     private int screenHeight;
+
+    // Scratch buffers for processVerticalImage, only ever touched by the photo loop thread
+    private BufferedImage blurScratchImage;
+    private BufferedImage blurScratchAlphaImage;
+    private BufferedImage blurFrostedImage;
+    private int[] blurRedSums;
+    private int[] blurGreenSums;
+    private int[] blurBlueSums;
     AppSettings appSettings = new AppSettings();
+    private SimpleDateFormat dateFormat;
+    private SimpleDateFormat timeFormat;
     private boolean m_isRunning = true;
     private javax.swing.Timer timer = null;
 
@@ -102,6 +149,9 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
         DEFAULT_ANIMATION_DURATION = appSettings.DefaultAnimationDuration;
         DEFAULT_SLEEP_DURATION = appSettings.DelayBetweenImages;
         DEFAULT_MAX_FPS = appSettings.DefaultMaxFPS;
+        // Only used from the Swing timer on the EDT, so sharing the (non thread-safe) formatters is fine
+        dateFormat = new SimpleDateFormat(appSettings.DateFormat);
+        timeFormat = new SimpleDateFormat(appSettings.TimeFormat);
         // Create and set up the back panel
         backPanel = new JPanel();
         SpringLayout springLayout = new SpringLayout();
@@ -167,104 +217,18 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
 
     // region Animations
     public void setSegue(BufferedImage sourceImage, BufferedImage destinationImage) {
-        switch (getRandInt(DEFAULT_MAX_ANIMATIONS)) {
-            case 1:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        PixelDissolveEffect.class);
-                break;
-            case 2:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        AlphaDissolveEffect.class);
-                break;
-            case 3:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        CheckerboardEffect.class);
-                break;
-            case 4:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        BlindsEffect.class);
-                break;
-            case 5:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ScrollLeftEffect.class);
-                break;
-            case 6:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ScrollRightEffect.class);
-                break;
-            case 7:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ScrollUpEffect.class);
-                break;
-            case 8:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ScrollDownEffect.class);
-                break;
-            case 9:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        WipeLeftEffect.class);
-                break;
-            case 10:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        WipeRightEffect.class);
-                break;
-            case 11:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        WipeUpEffect.class);
-                break;
-            case 12:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        WipeDownEffect.class);
-                break;
-            case 13:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ZoomOutEffect.class);
-                break;
-            case 14:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ZoomInEffect.class);
-                break;
-            case 15:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        IrisOpenEffect.class);
-                break;
-            case 16:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        IrisCloseEffect.class);
-                break;
-            case 17:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        BarnDoorOpenEffect.class);
-                break;
-            case 18:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        BarnDoorCloseEffect.class);
-                break;
-            case 19:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ShrinkToBottomEffect.class);
-                break;
-            case 20:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ShrinkToTopEffect.class);
-                break;
-            case 21:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        ShrinkToCenterEffect.class);
-                break;
-            case 22:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        StretchFromBottomEffect.class);
-                break;
-            case 23:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        StretchFromTopEffect.class);
-                break;
-            default:
-                currentSegue = buildSegue(sourceImage, destinationImage,
-                        StretchFromCenterEffect.class);
-                break;
+        // Walk the effects in shuffled order and reshuffle only once all of them have been shown.
+        if (effectIdx >= effectOrder.size()) {
+            // Only meaningful once a round has been shown: the last entry is the effect that just played
+            Class<? extends AnimatedSegue> lastEffect = currentSegue == null ? null : effectOrder.get(effectOrder.size() - 1);
+            Collections.shuffle(effectOrder, ThreadLocalRandom.current());
+            effectIdx = 0;
+
+            // Don't let the new round open with the effect the previous one ended on
+            if (effectOrder.get(0) == lastEffect && effectOrder.size() > 1)
+                Collections.swap(effectOrder, 0, 1 + ThreadLocalRandom.current().nextInt(effectOrder.size() - 1));
         }
+        currentSegue = buildSegue(sourceImage, destinationImage, effectOrder.get(effectIdx++));
     }
 
     public AnimatedSegue buildSegue(BufferedImage source, BufferedImage destination,
@@ -293,55 +257,42 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
 
     private void startPhotoLoop() {
         new Thread(() -> {
-            BufferedImage resizedSourceImage = null;
-            BufferedImage resizedDestinationImage = null;
             BufferedImage currentImage = null;
             BufferedImage nextImage = null;
 
             try {
-                currentImage = ImageIO.read(new File(photos.get( getRandInt(photos.size() - 1))));
-            } catch (IOException e) {
+                currentImage = prepareReadableImage();
+            } catch (InterruptedException e) {
                 logException(e);
                 return;
             }
 
             while (m_isRunning) {
-                int currentImageIdx = getRandInt(photos.size() - 1);
-                int nextImageIdx = getRandInt(photos.size() - 1);
-
-                while (currentImageIdx == nextImageIdx) {
-                    // Make sure not to show the same image twice, also if there are not lot of
-                    // images,
-                    // skip this loop. this is a very rare occasion with large image libraries.
-                    if (photos.size() < 10)
-                        break;
-                    nextImageIdx = getRandInt(photos.size() - 1);
-                }
-
                 try {
-                    //currentImage = ImageIO.read(new File(photos.get(currentImageIdx)));
-                    nextImage = ImageIO.read(new File(photos.get(nextImageIdx % photos.size())));
-                    // Check if image is vertical and needs special handling
-
-                    if(isImageVertical(currentImage))
-                        currentImage = processVerticalImage(currentImage);
-
-                    if (isImageVertical(nextImage)) {
-                        nextImage = processVerticalImage(nextImage);
-                    } else {
-                        nextImage = resizeImage(nextImage, screenWidth, screenHeight);
-                    }
-
-                    resizedSourceImage = resizeImage(currentImage, screenWidth, screenHeight);
+                    // Normally the next image was already prepared while the previous one was on screen.
+                    if (nextImage == null)
+                        nextImage = prepareReadableImage();
 
-                    setSegue(resizedSourceImage, nextImage);
+                    // currentImage is always the previous destination (or the first prepared image),
+                    // so it is already fitted to the screen and in the display format.
+                    setSegue(currentImage, nextImage);
                     currentSegue.start();
+                    long displayStart = System.nanoTime();
                     currentImage= nextImage;
 
-                    Thread.sleep(DEFAULT_SLEEP_DURATION);
-                } catch (IOException e) {
-                    logException(e);
-                    continue;
+                    // Let the transition finish first so preparing the next image doesn't compete with
+                    // rendering its frames, then prepare it while this one is displayed and only wait
+                    // out what is left of the delay.
+                    Thread.sleep(DEFAULT_ANIMATION_DURATION);
+                    try {
+                        nextImage = prepareNextImage();
+                    } catch (IOException e) {
+                        logException(e);
+                        nextImage = null;
+                    }
+
+                    long elapsed = TimeUnit.NANOSECONDS.toMillis(System.nanoTime() - displayStart);
+                    Thread.sleep(Math.max(0, DEFAULT_SLEEP_DURATION - elapsed));
                 } catch (InterruptedException e) {
                     logException(e);
                     m_isRunning = false;
@@ -351,6 +302,46 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
         }).start();
     }
 
+    private BufferedImage prepareReadableImage() throws InterruptedException {
+        // Keep picking until a photo decodes, backing off so an unreadable library doesn't spin the CPU
+        while (true) {
+            try {
+                return prepareNextImage();
+            } catch (IOException e) {
+                logException(e);
+                Thread.sleep(UNREADABLE_PHOTO_RETRY_DELAY);
+            }
+        }
+    }
+
+    private BufferedImage prepareNextImage() throws IOException {
+        int currentImageIdx = getRandInt(photos.size() - 1);
+        int nextImageIdx = getRandInt(photos.size() - 1);
+
+        while (currentImageIdx == nextImageIdx) {
+            // Make sure not to show the same image twice, also if there are not lot of
+            // images,
+            // skip this loop. this is a very rare occasion with large image libraries.
+            if (photos.size() < 10)
+                break;
+            nextImageIdx = getRandInt(photos.size() - 1);
+        }
+
+        return prepareImage(photos.get(nextImageIdx % photos.size()));
+    }
+
+    private BufferedImage prepareImage(String imagePath) throws IOException {
+        BufferedImage image = ImageIO.read(new File(imagePath));
+        if (image == null)
+            throw new IOException("No image reader for " + imagePath);
+
+        // Check if image is vertical and needs special handling
+        if (isImageVertical(image))
+            return processVerticalImage(image);
+
+        return resizeImage(image, screenWidth, screenHeight);
+    }
+
     private boolean isImageVertical(BufferedImage image) {
         return image.getHeight() > image.getWidth();
     }
@@ -359,9 +350,37 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
         int targetWidth = screenWidth;
         int targetHeight = screenHeight;
 
+        // The stretched image, the blur output and the blur sums are scratch space, so they are allocated
+        // once and reused for every vertical image instead of churning through full-screen buffers per photo.
+        if (blurRedSums == null) {
+            blurFrostedImage = new BufferedImage(targetWidth, targetHeight, BufferedImage.TYPE_INT_RGB);
+            blurRedSums = new int[targetWidth * targetHeight];
+            blurGreenSums = new int[targetWidth * targetHeight];
+            blurBlueSums = new int[targetWidth * targetHeight];
+        }
+
+        // Opaque sources stretch into an INT_RGB buffer. Sources with transparency keep an INT_ARGB one,
+        // so partially transparent pixels keep their un-premultiplied color instead of blurring darker.
+        BufferedImage stretchedImage;
+        boolean isOpaque = image.getTransparency() == Transparency.OPAQUE;
+        if (isOpaque) {
+            if (blurScratchImage == null)
+                blurScratchImage = new BufferedImage(targetWidth, targetHeight, BufferedImage.TYPE_INT_RGB);
+            stretchedImage = blurScratchImage;
+        } else {
+            if (blurScratchAlphaImage == null)
+                blurScratchAlphaImage = new BufferedImage(targetWidth, targetHeight, BufferedImage.TYPE_INT_ARGB);
+            stretchedImage = blurScratchAlphaImage;
+        }
+
         // Stretch image to fit screen dimensions (optional: adjust positioning)
-        BufferedImage stretchedImage = new BufferedImage(targetWidth, targetHeight, BufferedImage.TYPE_INT_ARGB);
         Graphics2D g2d = stretchedImage.createGraphics();
+        if (!isOpaque) {
+            // Transparent pixels blur as black; clear what the previous image left behind
+            g2d.setComposite(AlphaComposite.Clear);
+            g2d.fillRect(0, 0, targetWidth, targetHeight);
+            g2d.setComposite(AlphaComposite.SrcOver);
+        }
         g2d.drawImage(image, 0, 0, targetWidth, targetHeight, null);
         g2d.dispose();
 
@@ -369,43 +388,104 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
         int kernelSize = 50; // Larger kernel for a stronger frosted effect
         int kernelRadius = kernelSize / 2;
 
-        BufferedImage frostedImage = new BufferedImage(targetWidth, targetHeight, BufferedImage.TYPE_INT_ARGB);
-        for (int y = 0; y < targetHeight; y++) {
+        // Separable running-sum box blur, read from and written to the images' backing int arrays.
+        int[] pixels = ((DataBufferInt) stretchedImage.getRaster().getDataBuffer()).getData();
+        int[] frostedPixels = ((DataBufferInt) blurFrostedImage.getRaster().getDataBuffer()).getData();
+        int[] redSums = blurRedSums;
+        int[] greenSums = blurGreenSums;
+        int[] blueSums = blurBlueSums;
+
+        // Rows are independent, so spread them across all cores.
+        IntStream.range(0, targetHeight).parallel().forEach(y -> {
+            int rowStart = y * targetWidth;
+            int red = 0, green = 0, blue = 0;
+            for (int x = 0; x <= kernelRadius && x < targetWidth; x++) {
+                int color = pixels[rowStart + x];
+                red += (color >> 16) & 0xff;
+                green += (color >> 8) & 0xff;
+                blue += color & 0xff;
+            }
             for (int x = 0; x < targetWidth; x++) {
-                int red = 0, green = 0, blue = 0, count = 0;
-                // Sample neighboring pixels (larger kernel size)
-                for (int i = -kernelRadius; i <= kernelRadius; i++) {
-                    for (int j = -kernelRadius; j <= kernelRadius; j++) {
-                        int currentX = x + i;
-                        int currentY = y + j;
-                        if (currentX < 0 || currentX >= targetWidth || currentY < 0 || currentY >= targetHeight) {
-                            continue; // Handle pixels outside the image bounds
-                        }
-                        int color = stretchedImage.getRGB(currentX, currentY);
-                        red += (color >> 16) & 0xff;
-                        green += (color >> 8) & 0xff;
-                        blue += color & 0xff;
-                        count++;
+                redSums[rowStart + x] = red;
+                greenSums[rowStart + x] = green;
+                blueSums[rowStart + x] = blue;
+
+                int entering = x + kernelRadius + 1;
+                if (entering < targetWidth) {
+                    int color = pixels[rowStart + entering];
+                    red += (color >> 16) & 0xff;
+                    green += (color >> 8) & 0xff;
+                    blue += color & 0xff;
+                }
+                int leaving = x - kernelRadius;
+                if (leaving >= 0) {
+                    int color = pixels[rowStart + leaving];
+                    red -= (color >> 16) & 0xff;
+                    green -= (color >> 8) & 0xff;
+                    blue -= color & 0xff;
+                }
+            }
+        });
+
+        // Vertical pass, split into bands of columns so every worker walks its rows sequentially.
+        int bandWidth = 64;
+        IntStream.range(0, (targetWidth + bandWidth - 1) / bandWidth).parallel().forEach(band -> {
+            int firstX = band * bandWidth;
+            int lastX = Math.min(firstX + bandWidth, targetWidth);
+            int[] red = new int[lastX - firstX];
+            int[] green = new int[lastX - firstX];
+            int[] blue = new int[lastX - firstX];
+            for (int y = 0; y <= kernelRadius && y < targetHeight; y++) {
+                for (int x = firstX; x < lastX; x++) {
+                    red[x - firstX] += redSums[y * targetWidth + x];
+                    green[x - firstX] += greenSums[y * targetWidth + x];
+                    blue[x - firstX] += blueSums[y * targetWidth + x];
+                }
+            }
+            for (int y = 0; y < targetHeight; y++) {
+                // Pixels outside the image bounds are skipped, so the average only covers the clipped window
+                int countY = Math.min(y + kernelRadius, targetHeight - 1) - Math.max(y - kernelRadius, 0) + 1;
+                int entering = y + kernelRadius + 1;
+                int leaving = y - kernelRadius;
+                for (int x = firstX; x < lastX; x++) {
+                    int countX = Math.min(x + kernelRadius, targetWidth - 1) - Math.max(x - kernelRadius, 0) + 1;
+                    int count = countX * countY;
+                    int i = x - firstX;
+
+                    // Average the color values
+                    int avgRed = red[i] / count;
+                    int avgGreen = green[i] / count;
+                    int avgBlue = blue[i] / count;
+                    frostedPixels[y * targetWidth + x] = (0xff << 24) | (avgRed << 16) | (avgGreen << 8) | avgBlue;
+
+                    if (entering < targetHeight) {
+                        red[i] += redSums[entering * targetWidth + x];
+                        green[i] += greenSums[entering * targetWidth + x];
+                        blue[i] += blueSums[entering * targetWidth + x];
+                    }
+                    if (leaving >= 0) {
+                        red[i] -= redSums[leaving * targetWidth + x];
+                        green[i] -= greenSums[leaving * targetWidth + x];
+                        blue[i] -= blueSums[leaving * targetWidth + x];
                     }
                 }
-                // Average the color values
-                int avgRed = red / count;
-                int avgGreen = green / count;
-                int avgBlue = blue / count;
-                frostedImage.setRGB(x, y, (0xff << 24) | (avgRed << 16) | (avgGreen << 8) | avgBlue);
             }
-        }
+        });
 
-        // Overlay original image centered on frosted image (optional: adjust positioning)
-        BufferedImage finalImage = overlayImage(frostedImage, image, (targetWidth - image.getWidth()) / 2, (targetHeight - image.getHeight()) / 2);
+        // Composite the blur and the centered original into a screen-compatible image, so the segues
+        // and repaints of portrait photos don't convert the pixel format on every draw.
+        BufferedImage frostedImage = getGraphicsConfiguration().createCompatibleImage(targetWidth, targetHeight, Transparency.OPAQUE);
+        Graphics2D frostedG2d = frostedImage.createGraphics();
+        frostedG2d.drawImage(blurFrostedImage, 0, 0, null);
+        frostedG2d.drawImage(image, (targetWidth - image.getWidth()) / 2, (targetHeight - image.getHeight()) / 2, null);
+        frostedG2d.dispose();
 
-        return finalImage;
+        return frostedImage;
     }
 
     private static void logException(Exception e) {
         LocalTime currentTime = LocalTime.now();
-        DateTimeFormatter formatter = DateTimeFormatter.ofPattern("HH:mm:ss");
-        String formattedTime = currentTime.format(formatter);
+        String formattedTime = currentTime.format(LOG_TIME_FORMATTER);
 
         try (FileWriter fw = new FileWriter("exceptions.log", true)) {
             fw.write( formattedTime + " **ERROR** ::" + e.toString() + "\n");
@@ -415,17 +495,6 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
         }
     }
 
-    public static BufferedImage overlayImage(BufferedImage background, BufferedImage foreground, int x, int y) {
-        int targetWidth = Math.max(background.getWidth(), foreground.getWidth() + x);
-        int targetHeight = Math.max(background.getHeight(), foreground.getHeight() + y);
-        BufferedImage finalImage = new BufferedImage(targetWidth, targetHeight, BufferedImage.TYPE_INT_ARGB);
-        Graphics2D g2d = finalImage.createGraphics();
-        g2d.drawImage(background, 0, 0, null);
-        g2d.drawImage(foreground, x, y, null);
-        g2d.dispose();
-        return finalImage;
-    }
-
     private List<String> loadPhotos() {
         List<String> paths = new ArrayList<>();
         try {
@@ -446,12 +515,7 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
 
             // Use Stream API and Path API
             paths = Files.list(directoryPath)
-                    .filter(file -> file.toFile().isFile() &&
-                            (file.toString().toLowerCase().endsWith(".jpg") ||
-                                    file.toString().toLowerCase().endsWith(".png") ||
-                                    file.toString().toLowerCase().endsWith(".jpeg") ||
-                                    file.toString().toLowerCase().endsWith(".heic") ||
-                                    file.toString().toLowerCase().endsWith(".heif")))
+                    .filter(file -> file.toFile().isFile() && hasPhotoExtension(file))
                     .map(Path::toString)
                     .collect(Collectors.toList());
         } catch (Exception e) {
@@ -460,6 +524,12 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
         return paths;
     }
 
+    private static boolean hasPhotoExtension(Path file) {
+        String fileName = file.getFileName().toString().toLowerCase();
+        int extensionStart = fileName.lastIndexOf('.');
+        return extensionStart >= 0 && PHOTO_EXTENSIONS.contains(fileName.substring(extensionStart));
+    }
+
     private BufferedImage resizeImage(BufferedImage image, int targetWidth, int targetHeight) {
 //        BufferedImage resizedImage = new BufferedImage(targetWidth, targetHeight, BufferedImage.TYPE_INT_ARGB);
 ////        Graphics2D g2d = resizedImage.createGraphics();
@@ -476,30 +546,77 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
         int newWidth = (int) (image.getWidth() * ratio);
         int newHeight = (int) (image.getHeight() * ratio);
 
-        // Create a new resized image
-        BufferedImage resizedImage = new BufferedImage(newWidth, newHeight, image.getType());
-        resizedImage.getGraphics().drawImage(image.getScaledInstance(newWidth, newHeight, java.awt.Image.SCALE_SMOOTH), 0, 0, null);
+        // Downscale in halving steps with bilinear filtering. This keeps the smooth, area-averaged
+        // look of SCALE_SMOOTH at a fraction of its cost; upscaling is done in a single step.
+        BufferedImage resizedImage = image;
+        int width = image.getWidth();
+        int height = image.getHeight();
+        do {
+            width = width > newWidth ? Math.max(width / 2, newWidth) : newWidth;
+            height = height > newHeight ? Math.max(height / 2, newHeight) : newHeight;
+            boolean isFinalStep = width == newWidth && height == newHeight;
+            resizedImage = scaleImage(resizedImage, width, height, isFinalStep);
+        } while (width != newWidth || height != newHeight);
 
         return resizedImage;
+    }
 
-
+    private BufferedImage scaleImage(BufferedImage image, int width, int height, boolean isFinalStep) {
+        // The final step uses the screen's native pixel layout so the label and the segues can draw it
+        // without converting; on a 16 bit screen Java2D packs it to RGB565 here. Intermediate steps stay in
+        // full 8-bit-per-channel INT formats, so a 16 bit screen format doesn't get quantized and then
+        // filtered again.
+        BufferedImage scaledImage;
+        if (isFinalStep) {
+            scaledImage = getGraphicsConfiguration().createCompatibleImage(width, height, image.getTransparency());
+        } else {
+            int type = image.getTransparency() == Transparency.OPAQUE ? BufferedImage.TYPE_INT_RGB : BufferedImage.TYPE_INT_ARGB;
+            scaledImage = new BufferedImage(width, height, type);
+        }
+        Graphics2D g2d = scaledImage.createGraphics();
+        g2d.setRenderingHint(RenderingHints.KEY_INTERPOLATION, RenderingHints.VALUE_INTERPOLATION_BILINEAR);
+        g2d.drawImage(image, 0, 0, width, height, null);
+        g2d.dispose();
+        return scaledImage;
     }
 
     @Override
     public void onFrameRendered(AnimatedSegue segue, BufferedImage image) {
-        photoLabel.setIcon(new ImageIcon(image));
+        // Frames are rendered off the EDT; only the label update itself is posted to it. A frame that
+        // arrives while an update is still queued just replaces it, so a busy EDT paints only the newest one.
+        if (!SwingUtilities.isEventDispatchThread()) {
+            if (pendingFrame.getAndSet(image) == null)
+                SwingUtilities.invokeLater(() -> showFrame(pendingFrame.getAndSet(null)));
+            return;
+        }
+
+        showFrame(image);
+    }
+
+    private void showFrame(BufferedImage image) {
+        // Keep one icon on the label and swap its image. Unlike ImageIcon it doesn't push each frame through
+        // the shared MediaTracker.
+        boolean sizeChanged = photoIcon.getIconWidth() != image.getWidth() || photoIcon.getIconHeight() != image.getHeight();
+        photoIcon.setImage(image);
+
+        if (photoLabel.getIcon() != photoIcon)
+            photoLabel.setIcon(photoIcon);
+        else if (sizeChanged)
+            photoLabel.revalidate();
+
+        photoLabel.repaint();
     }
 
     private void updateDateTimeLabel() {
-        String date = new SimpleDateFormat(appSettings.DateFormat).format(new Date());
-        String time = new SimpleDateFormat(appSettings.TimeFormat).format(new Date());
+        Date now = new Date();
+        String date = dateFormat.format(now);
+        String time = timeFormat.format(now);
         timeLabel.setText(time);
         dateLabel.setText(date);
     }
 
     public static int getRandInt(int max) {
-        Random random = new Random();
-        return random.nextInt(max) + 1;
+        return ThreadLocalRandom.current().nextInt(max) + 1;
     }
 
     public static String readFile(String filePath) throws IOException {
@@ -517,6 +634,31 @@ public class PhotoFrame extends JFrame implements SegueAnimationObserver {
         return content.toString().trim();
     }
 
+    // Paints the current frame directly; frames are fully rendered BufferedImages, so no image loading is needed.
+    private static class FrameIcon implements Icon {
+        private BufferedImage image;
+
+        void setImage(BufferedImage image) {
+            this.image = image;
+        }
+
+        @Override
+        public void paintIcon(Component c, Graphics g, int x, int y) {
+            if (image != null)
+                g.drawImage(image, x, y, null);
+        }
+
+        @Override
+        public int getIconWidth() {
+            return image == null ? 0 : image.getWidth();
+        }
+
+        @Override
+        public int getIconHeight() {
+            return image == null ? 0 : image.getHeight();
+        }
+    }
+
     public static void main(String[] args) {
         PhotoFrame frame = new PhotoFrame();
         frame.setVisible(true);